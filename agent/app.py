@@ -3,14 +3,20 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import AsyncExitStack
-from typing import Optional
+from typing import Any, Coroutine, Optional
 
 import numpy as np
 
+try:  # pragma: no cover - optional faster event loop
+    import uvloop
+except Exception:  # pragma: no cover
+    uvloop = None
+
 from .audio_input import MicrophoneStream, MockMicrophoneStream
 from .audio_output import NullSpeakerStream, SpeakerStream
 from .barge_in import BargeInDetector
 from .config import settings
+from .http_client import close_session
 from .llm import llm_stream
 from .states import STATE_LISTENING, STATE_SPEAKING, STATE_THINKING
 from .stt import STTStream
@@ -48,12 +54,11 @@ class AgentApp:
 
     async def _handle_user_text(self, text: str) -> None:
         self._set_state(STATE_THINKING)
-        self.stop_llm_event.clear()
-        self.stop_tts_event.clear()
+        self.barge_in.reset()
         self.speaker.clear()
 
         async def token_generator():
-            queue: asyncio.Queue[str] = asyncio.Queue()
+            queue: asyncio.Queue[Optional[str]] = asyncio.Queue()
 
             def on_token(token: str) -> None:
                 queue.put_nowait(token)
@@ -61,12 +66,17 @@ class AgentApp:
             llm_task = asyncio.create_task(
                 llm_stream(text, on_token, stop_event=self.stop_llm_event)
             )
+            # A None sentinel ends the stream once the LLM has finished.
+            llm_task.add_done_callback(lambda _: queue.put_nowait(None))
             try:
                 while True:
                     token = await queue.get()
+                    if token is None:
+                        break
                     yield token
             finally:
-                self.stop_tts_event.set()
+                if not llm_task.done():
+                    self.stop_llm_event.set()
                 await llm_task
 
         self._set_state(STATE_SPEAKING)
@@ -98,6 +108,7 @@ class AgentApp:
             print("Stopping agent...")
         finally:
             self.stop()
+            await close_session()
 
     def stop(self) -> None:
         self.stop_llm_event.set()
@@ -107,9 +118,19 @@ class AgentApp:
         self.speaker.stop()
 
 
+def run_event_loop(coro: Coroutine[Any, Any, None]) -> None:
+    """Run ``coro`` to completion, on uvloop when it is installed."""
+    # uvloop.run only exists from 0.18; older installs use the default loop.
+    uvloop_run = getattr(uvloop, "run", None)
+    if uvloop_run is not None:
+        uvloop_run(coro)
+    else:
+        asyncio.run(coro)
+
+
 def main():  # pragma: no cover - entrypoint
     app = AgentApp()
-    asyncio.run(app.run())
+    run_event_loop(app.run())
 
 
 if __name__ == "__main__":
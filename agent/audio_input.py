@@ -55,9 +55,12 @@ class MicrophoneStream:
                     print(f"Microphone status: {status}")
                 if self._stop_event.is_set():
                     raise sd.CallbackStop()
-                # Copy buffer to avoid referencing underlying memory
-                pcm = np.copy(indata[:, 0]).astype(np.float32)
-                asyncio.run_coroutine_threadsafe(self.queue.put(pcm), self.loop)
+                # Copy buffer to avoid referencing underlying memory. The stream
+                # already delivers float32, so one copy is all that is needed.
+                pcm = indata[:, 0].copy()
+                # The queue is unbounded, so put_nowait never blocks; scheduling
+                # it directly avoids wrapping every frame in a Task and Future.
+                self.loop.call_soon_threadsafe(self.queue.put_nowait, pcm)
 
             with sd.InputStream(
                 samplerate=settings.sample_rate,
@@ -67,8 +70,8 @@ class MicrophoneStream:
                 callback=callback,
             ) as stream:
                 self._stream = stream
-                while not self._stop_event.is_set():
-                    sd.sleep(settings.frame_duration_ms)
+                # Block until stop() instead of polling every frame.
+                self._stop_event.wait()
         except Exception as exc:  # pragma: no cover - hardware dependent
             if self.on_error:
                 self.on_error(exc)
@@ -84,7 +87,7 @@ class MockMicrophoneStream(MicrophoneStream):
         silence = np.zeros(frame_length, dtype=np.float32)
         try:
             while not self._stop_event.is_set():
-                asyncio.run_coroutine_threadsafe(self.queue.put(silence.copy()), self.loop)
+                self.loop.call_soon_threadsafe(self.queue.put_nowait, silence.copy())
                 sd.sleep(settings.frame_duration_ms)
         except Exception as exc:
             if self.on_error:
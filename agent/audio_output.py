@@ -6,7 +6,11 @@ import threading
 from typing import Optional
 
 import numpy as np
-import sounddevice as sd
+
+try:  # pragma: no cover - needs the PortAudio system library
+    import sounddevice as sd
+except Exception:  # pragma: no cover
+    sd = None
 
 from .config import settings
 
@@ -19,6 +23,12 @@ class SpeakerStream:
         self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._stream: Optional[sd.OutputStream] = None
+        # Clip currently being played and the read position within it, so a
+        # clip longer than one block is played across blocks from views.
+        self._current: Optional[np.ndarray] = None
+        self._current_pos = 0
+        # Held while a block is filled so clear() cannot interleave with it.
+        self._lock = threading.Lock()
 
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
@@ -43,11 +53,36 @@ class SpeakerStream:
 
     def clear(self) -> None:
         """Immediately drop queued audio for barge-in."""
-        while not self._queue.empty():
-            try:
-                self._queue.get_nowait()
-            except queue.Empty:
-                break
+        # Swapping in a fresh queue is O(1) regardless of backlog. The lock
+        # stops a block being filled concurrently from keeping a dropped clip.
+        with self._lock:
+            self._queue = queue.Queue()
+            self._current = None
+
+    def _fill(self, outdata: np.ndarray, frames: int) -> None:
+        """Fill one output block from queued clips, zero-padding any underrun."""
+        written = 0
+        with self._lock:
+            while written < frames:
+                data = self._current
+                if data is None:
+                    try:
+                        data = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    self._current = data
+                    self._current_pos = 0
+                pos = self._current_pos
+                count = min(len(data) - pos, frames - written)
+                outdata[written : written + count, 0] = data[pos : pos + count]
+                written += count
+                if pos + count >= len(data):
+                    self._current = None
+                else:
+                    self._current_pos = pos + count
+        # Pad underruns in place; the idle path allocates nothing.
+        if written < frames:
+            outdata[written:] = 0
 
     def _run(self) -> None:
         try:
@@ -56,15 +91,7 @@ class SpeakerStream:
                     print(f"Speaker status: {status}")
                 if self._stop_event.is_set():
                     raise sd.CallbackStop()
-                try:
-                    data = self._queue.get_nowait()
-                except queue.Empty:
-                    data = np.zeros(frames, dtype=np.float32)
-                if len(data) < frames:
-                    padded = np.zeros(frames, dtype=np.float32)
-                    padded[: len(data)] = data
-                    data = padded
-                outdata[:, 0] = data[:frames]
+                self._fill(outdata, frames)
 
             with sd.OutputStream(
                 samplerate=settings.sample_rate,
@@ -74,8 +101,8 @@ class SpeakerStream:
                 callback=callback,
             ) as stream:
                 self._stream = stream
-                while not self._stop_event.is_set():
-                    sd.sleep(settings.frame_duration_ms)
+                # Block until stop() instead of polling every frame.
+                self._stop_event.wait()
         except Exception as exc:  # pragma: no cover - hardware dependent
             print(f"SpeakerStream error: {exc}")
 
@@ -31,7 +31,8 @@ class BargeInDetector:
                 continue
             if pcm is None:
                 continue
-            energy = float(np.max(np.abs(pcm)))
+            # Peak amplitude without allocating an np.abs() temporary.
+            energy = float(max(pcm.max(), -pcm.min()))
             if energy > self.threshold:
                 for event in self._callbacks:
                     event.set()
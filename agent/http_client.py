@@ -0,0 +1,36 @@
+"""Shared HTTP session for the network-backed engines."""
+from __future__ import annotations
+
+from typing import Optional
+
+import aiohttp
+
+# DeepSeek and ElevenLabs requests share one connection pool so every
+# turn reuses warm keep-alive connections instead of opening new ones.
+_session: Optional[aiohttp.ClientSession] = None
+
+# aiohttp's default 15s keep-alive often expires between conversational
+# turns; holding idle connections longer keeps the next turn warm.
+_KEEPALIVE_TIMEOUT_SECONDS = 75
+# Only two API hosts are ever resolved, so cache lookups well past the 10s default.
+_DNS_CACHE_TTL_SECONDS = 300
+
+
+def get_session() -> aiohttp.ClientSession:
+    """Return the process-wide session, creating it on first use."""
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            keepalive_timeout=_KEEPALIVE_TIMEOUT_SECONDS,
+            ttl_dns_cache=_DNS_CACHE_TTL_SECONDS,
+        )
+        _session = aiohttp.ClientSession(connector=connector)
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session, if one was opened."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
@@ -2,11 +2,18 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Callable
+import json
+from typing import Callable, Optional
 
 import aiohttp
 
 from .config import settings
+from .http_client import get_session
+
+_DEEPSEEK_URL = "https://api.deepseek.com/chat/completions"
+_SSE_DONE = b"data: [DONE]"
+# Shared across requests; only the user turn changes between calls.
+_SYSTEM_MESSAGE = {"role": "system", "content": "You are a helpful voice assistant."}
 
 
 async def llm_stream(user_text: str, on_token: Callable[[str], None], *, stop_event: asyncio.Event) -> None:
@@ -22,24 +29,49 @@ async def llm_stream(user_text: str, on_token: Callable[[str], None], *, stop_ev
     payload = {
         "model": settings.deepseek_model,
         "messages": [
-            {"role": "system", "content": "You are a helpful voice assistant."},
+            _SYSTEM_MESSAGE,
             {"role": "user", "content": user_text},
         ],
         "stream": True,
     }
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post("https://api.deepseek.com/chat/completions", json=payload, headers=headers) as resp:
+    try:
+        async with get_session().post(_DEEPSEEK_URL, json=payload, headers=headers) as resp:
+            if resp.status != 200:
+                print(f"LLM error: {await resp.text()}")
+                return
             async for line in resp.content:
-                if stop_event.is_set():
+                if stop_event.is_set() or line.startswith(_SSE_DONE):
                     break
-                if not line:
-                    continue
-                token = line.decode(errors="ignore")
-                if token.startswith("data: "):
-                    token = token.replace("data: ", "", 1).strip()
+                token = _parse_sse_token(line)
                 if token:
                     on_token(token)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+        print(f"LLM error: {exc!r}")
+
+
+def _parse_sse_token(line: bytes) -> Optional[str]:
+    """Return the content delta carried by one ``data:`` line of the stream.
+
+    Only the prefix is checked before decoding so keep-alive and blank lines
+    are skipped without touching the JSON parser.
+    """
+    if not line.startswith(b"data: "):
+        return None
+    try:
+        chunk = json.loads(line[6:])
+    except ValueError:
+        return None
+    # Error payloads and malformed chunks must not end the turn, so every
+    # level of choices[0].delta.content is shape-checked before use.
+    choices = chunk.get("choices") if isinstance(chunk, dict) else None
+    if not isinstance(choices, list) or not choices or not isinstance(choices[0], dict):
+        return None
+    delta = choices[0].get("delta")
+    if not isinstance(delta, dict):
+        return None
+    content = delta.get("content")
+    return content if isinstance(content, str) else None
 
 
 async def _mock_stream(user_text: str, on_token: Callable[[str], None], *, stop_event: asyncio.Event) -> None:
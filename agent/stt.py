@@ -19,6 +19,10 @@ except Exception:  # pragma: no cover
 
 from .config import settings
 
+# Deepgram handles ~100ms chunks comfortably; batching 20-30ms microphone
+# frames up to this size cuts websocket sends several-fold.
+_DEEPGRAM_SEND_SECONDS = 0.06
+
 
 class STTStream:
     """Dispatch microphone frames to a streaming STT engine."""
@@ -102,12 +106,34 @@ class STTStream:
             "channels": settings.channels,
         })
 
+        send_samples = int(settings.sample_rate * _DEEPGRAM_SEND_SECONDS)
+
         async def sender():
+            batch: list[np.ndarray] = []
+            batched = 0
             while not self._stop_event.is_set():
                 pcm = await self._frame_queue.get()
                 if pcm is None:
                     continue
-                await socket.send(pcm.tobytes())
+                batch.append(pcm)
+                batched += len(pcm)
+                # Take frames that are already queued without yielding; the
+                # microphone keeps the queue fed, so a batch never waits long.
+                while batched < send_samples:
+                    try:
+                        pcm = self._frame_queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    if pcm is not None:
+                        batch.append(pcm)
+                        batched += len(pcm)
+                if batched < send_samples:
+                    continue
+                await socket.send(np.concatenate(batch).tobytes())
+                batch = []
+                batched = 0
+            if batch:
+                await socket.send(np.concatenate(batch).tobytes())
 
         async def receiver():
             async for msg in socket:
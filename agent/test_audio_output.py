@@ -0,0 +1,37 @@
+import numpy as np
+
+from agent.audio_output import SpeakerStream
+
+
+def _block(speaker, frames):
+    outdata = np.full((frames, 1), -1.0, dtype=np.float32)
+    speaker._fill(outdata, frames)
+    return outdata[:, 0].tolist()
+
+
+def test_fill_plays_clips_across_blocks():
+    speaker = SpeakerStream()
+    speaker.write(np.arange(1, 8, dtype=np.float32))
+    speaker.write(np.array([10, 11], dtype=np.float32))
+
+    assert _block(speaker, 3) == [1, 2, 3]
+    assert _block(speaker, 3) == [4, 5, 6]
+    assert _block(speaker, 3) == [7, 10, 11]
+    assert _block(speaker, 3) == [0, 0, 0]
+
+
+def test_fill_zero_pads_underrun():
+    speaker = SpeakerStream()
+    speaker.write(np.array([0.5, 0.25], dtype=np.float32))
+
+    assert _block(speaker, 4) == [0.5, 0.25, 0, 0]
+
+
+def test_clear_drops_partially_played_clip():
+    speaker = SpeakerStream()
+    speaker.write(np.arange(1, 8, dtype=np.float32))
+    _block(speaker, 3)
+
+    speaker.clear()
+
+    assert _block(speaker, 3) == [0, 0, 0]
@@ -0,0 +1,23 @@
+from agent.llm import _parse_sse_token
+
+
+def test_parse_sse_token_returns_content_delta():
+    line = b'data: {"choices": [{"delta": {"content": "Hello"}}]}\n'
+    assert _parse_sse_token(line) == "Hello"
+
+
+def test_parse_sse_token_skips_non_content_lines():
+    assert _parse_sse_token(b"\n") is None
+    assert _parse_sse_token(b": keep-alive\n") is None
+    assert _parse_sse_token(b'data: {"choices": [{"delta": {"role": "assistant"}}]}\n') is None
+    assert _parse_sse_token(b"data: [DONE]\n") is None
+
+
+def test_parse_sse_token_tolerates_unexpected_shapes():
+    assert _parse_sse_token(b'data: {"choices": [{"delta": null}]}\n') is None
+    assert _parse_sse_token(b'data: ["not", "a", "chunk"]\n') is None
+    assert _parse_sse_token(b'data: {"error": {"message": "rate limited"}}\n') is None
+    assert _parse_sse_token(b'data: {"choices": {"a": 1}}\n') is None
+    assert _parse_sse_token(b'data: {"choices": [{"delta": "x"}]}\n') is None
+    assert _parse_sse_token(b'data: {"choices": []}\n') is None
+    assert _parse_sse_token(b'data: {"choices": [{"delta": {"content": 5}}]}\n') is None
@@ -0,0 +1,32 @@
+import asyncio
+
+from agent.tts import _iter_sentences
+
+
+def _sentences(tokens):
+    async def tokens_stream():
+        for token in tokens:
+            yield token
+
+    async def collect():
+        return [sentence async for sentence in _iter_sentences(tokens_stream())]
+
+    return asyncio.run(collect())
+
+
+def test_iter_sentences_splits_boundary_across_tokens():
+    assert _sentences(["Hi.", " There"]) == ["Hi.", "There"]
+
+
+def test_iter_sentences_does_not_split_inside_numbers():
+    assert _sentences(["Pi is 3", ".14", " roughly."]) == ["Pi is 3.14 roughly."]
+
+
+def test_iter_sentences_flushes_tail():
+    assert _sentences(["Done! And", " then"]) == ["Done!", "And then"]
+
+
+
+def test_iter_sentences_keeps_run_on_reply_whole():
+    reply = "alpha, " + "word " * 60 + "end"
+    assert _sentences(list(reply)) == [reply]
@@ -2,49 +2,132 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Iterable
+from typing import TYPE_CHECKING, AsyncIterable, AsyncIterator
 
+import aiohttp
 import numpy as np
-import requests
 
 from .config import settings
-from .audio_output import SpeakerStream
+from .http_client import get_session
 
+if TYPE_CHECKING:  # pragma: no cover - annotations only; avoids loading PortAudio
+    from .audio_output import SpeakerStream
 
-async def stream_tts(text_stream: Iterable[str], speaker: SpeakerStream, *, stop_event: asyncio.Event) -> None:
+# Playback is paced inside the response body, so bound each read rather
+# than the whole request; a long sentence must not time out mid-clip.
+_TTS_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=30)
+_SAMPLE_BYTES = np.dtype(np.float32).itemsize
+# ~200ms of audio per read, so playback starts before synthesis finishes.
+_TTS_CHUNK_SECONDS = 0.2
+_TTS_CHUNK_BYTES = int(settings.sample_rate * _TTS_CHUNK_SECONDS) * _SAMPLE_BYTES
+_SENTENCE_ENDINGS = frozenset(".!?")
+
+
+class _PlaybackClock:
+    """Track when audio handed to the speaker will have finished playing."""
+
+    def __init__(self):
+        self._loop = asyncio.get_running_loop()
+        self._end = self._loop.time()
+
+    def add(self, seconds: float) -> None:
+        self._end = max(self._end, self._loop.time()) + seconds
+
+    async def wait(self, *, lead: float = 0.0) -> None:
+        """Sleep until at most ``lead`` seconds of audio remain queued."""
+        delay = self._end - lead - self._loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def stream_tts(text_stream: AsyncIterable[str], speaker: SpeakerStream, *, stop_event: asyncio.Event) -> None:
     """Stream TTS output to the speaker, stopping immediately on interruption."""
     if settings.use_mock_tts or settings.elevenlabs_api_key is None:
         await _mock_tts(text_stream, speaker, stop_event=stop_event)
         return
-    for text in text_stream:
+    clock = _PlaybackClock()
+    async for text in _iter_sentences(text_stream):
         if stop_event.is_set():
             break
-        audio = _elevenlabs_tts(text)
-        if audio is None:
-            continue
-        await _play_chunks(audio, speaker, stop_event)
+        await _elevenlabs_tts(text, speaker, stop_event, clock)
+    if not stop_event.is_set():
+        await clock.wait()
+
+
+async def _iter_sentences(tokens: AsyncIterable[str]) -> AsyncIterator[str]:
+    """Group streamed LLM tokens into sentences so each is synthesized once.
+
+    Only characters not yet examined are scanned as tokens arrive, keeping
+    boundary detection linear in the length of the response.
+    """
+    pending = ""
+    scan_from = 0
+    async for token in tokens:
+        pending += token
+        cut = 0
+        for i in range(scan_from, len(pending) - 1):
+            if pending[i] in _SENTENCE_ENDINGS and pending[i + 1].isspace():
+                cut = i + 1
+        if cut:
+            sentence = pending[:cut].strip()
+            if sentence:
+                yield sentence
+            pending = pending[cut:]
+        # The last character has no successor yet, so it is rescanned next time.
+        scan_from = max(len(pending) - 1, 0)
+    tail = pending.strip()
+    if tail:
+        yield tail
 
 
-def _elevenlabs_tts(text: str) -> bytes | None:  # pragma: no cover - network dependent
+async def _elevenlabs_tts(
+    text: str, speaker: SpeakerStream, stop_event: asyncio.Event, clock: _PlaybackClock
+) -> None:  # pragma: no cover - network dependent
     url = f"https://api.elevenlabs.io/v1/text-to-speech/{settings.elevenlabs_voice}/stream"
     headers = {"xi-api-key": settings.elevenlabs_api_key, "Accept": "audio/mpeg"}
     payload = {"text": text, "model_id": "eleven_multilingual_v2"}
-    resp = requests.post(url, json=payload, headers=headers, stream=True, timeout=30)
-    if resp.status_code != 200:
-        print(f"TTS error: {resp.text}")
-        return None
-    return resp.content
+    try:
+        async with get_session().post(url, json=payload, headers=headers, timeout=_TTS_TIMEOUT) as resp:
+            if resp.status != 200:
+                print(f"TTS error: {await resp.text()}")
+                return
+            # Play audio as it downloads rather than buffering the whole clip.
+            stopped = stop_event.is_set
+            # Reads need not end on a sample boundary; the split sample's
+            # bytes (at most three) wait here so chunks are never re-joined.
+            carry = bytearray()
+            async for chunk in resp.content.iter_chunked(_TTS_CHUNK_BYTES):
+                if stopped():
+                    break
+                view = memoryview(chunk)
+                if carry:
+                    need = _SAMPLE_BYTES - len(carry)
+                    carry += view[:need]
+                    view = view[need:]
+                    if len(carry) == _SAMPLE_BYTES:
+                        await _play_chunks(bytes(carry), speaker, clock)
+                        carry.clear()
+                usable = len(view) - len(view) % _SAMPLE_BYTES
+                if usable:
+                    # memoryview slicing hands the samples over without a copy.
+                    await _play_chunks(view[:usable], speaker, clock)
+                carry += view[usable:]
+    except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+        print(f"TTS error: {exc!r}")
 
 
-async def _play_chunks(audio_bytes: bytes, speaker: SpeakerStream, stop_event: asyncio.Event) -> None:
+async def _play_chunks(audio_bytes: bytes | memoryview, speaker: SpeakerStream, clock: _PlaybackClock) -> None:
     # Placeholder: convert bytes to PCM. Real implementation would decode mp3/opus.
     pcm = np.frombuffer(audio_bytes, dtype=np.float32)
     speaker.write(pcm)
-    await asyncio.sleep(len(pcm) / settings.sample_rate)
+    clock.add(len(pcm) / settings.sample_rate)
+    # Stay one chunk ahead of the speaker so the next download overlaps
+    # playback instead of starting only after this chunk has finished.
+    await clock.wait(lead=_TTS_CHUNK_SECONDS)
 
 
-async def _mock_tts(text_stream: Iterable[str], speaker: SpeakerStream, *, stop_event: asyncio.Event) -> None:
-    for chunk in text_stream:
+async def _mock_tts(text_stream: AsyncIterable[str], speaker: SpeakerStream, *, stop_event: asyncio.Event) -> None:
+    async for chunk in text_stream:
         if stop_event.is_set():
             break
         duration = max(0.05, len(chunk) / 40.0)
@@ -1,15 +1,13 @@
 """Local integration harness for the telephone agent."""
 from __future__ import annotations
 
-import asyncio
-
-from agent.app import AgentApp
+from agent.app import AgentApp, run_event_loop
 
 
 def main():  # pragma: no cover - manual integration
     app = AgentApp()
     try:
-        asyncio.run(app.run())
+        run_event_loop(app.run())
     except KeyboardInterrupt:
         app.stop()
 